@@ -1,5 +1,10 @@
+import asyncio
+
+from aioconsole import ainput
 from dotenv import load_dotenv
 
+from langchain_community.cache import SQLiteCache
+from langchain_core.globals import set_llm_cache
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_core.tools import tool
@@ -10,18 +15,21 @@ from langgraph.prebuilt.tool_node import ToolNode
 
 load_dotenv()
 
+# Repeated prompts are answered from disk instead of another OpenAI round-trip
+set_llm_cache(SQLiteCache(database_path=".langchain.db"))
+
 # -------------------------
 # Tools
 # -------------------------
 
 @tool
-def calculator(a: float, b: float) -> str:
+async def calculator(a: float, b: float) -> str:
     """Perform basic arithmetic addition."""
     print("calculator tool called")
     return f"The sum of {a} and {b} is {a + b}"
 
 @tool
-def say_hello(name: str) -> str:
+async def say_hello(name: str) -> str:
     """Greet a user by name."""
     print("say_hello tool called")
     return f"Hello {name}, I hope you are well today."
@@ -48,8 +56,8 @@ class AgentState(dict):
 # Nodes
 # -------------------------
 
-def agent_node(state: AgentState):
-    response = model.invoke(state["messages"])
+async def agent_node(state: AgentState):
+    response = await model.ainvoke(state["messages"])
     return {"messages": [response]}
 
 tool_node = ToolNode(tools)
@@ -78,17 +86,17 @@ workflow = workflow.compile()
 # Main Loop
 # -------------------------
 
-def main():
+async def main():
     print("Welcome! I'm your AI assistant. Type 'quit' to exit.")
 
     while True:
-        user_input = input("\nYou: ").strip()
+        user_input = (await ainput("\nYou: ")).strip()
         if user_input.lower() == "quit":
             break
 
         print("\nAssistant: ", end="", flush=True)
 
-        for chunk in workflow.stream(
+        async for chunk in workflow.astream(
             {"messages": [HumanMessage(content=user_input)]},
             stream_mode="values",
         ):
@@ -100,4 +108,4 @@ def main():
         print()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
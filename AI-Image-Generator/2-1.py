@@ -1,24 +1,49 @@
+import math
+import sys
+
 import torch
 from diffusers import StableDiffusionPipeline, DPMSolverMultistepScheduler
+from optimum.quanto import freeze, qint8, quantize
 
 small_model = "Manojb/stable-diffusion-2-1-base"
 
+# Let cuDNN pick the fastest NHWC conv kernels for the fixed 512x512 shape
+torch.backends.cudnn.benchmark = True
+
+# Number of prompts per UNet forward pass, 4 fits in 12GB of VRAM at 512x512
+BATCH_SIZE = 4
+
 pipe = StableDiffusionPipeline.from_pretrained(small_model, torch_dtype=torch.float16)
 pipe.scheduler = DPMSolverMultistepScheduler.from_config(pipe.scheduler.config)
-pipe.enable_attention_slicing()
 pipe = pipe.to("cuda")
+pipe.unet.to(memory_format=torch.channels_last)
+pipe.vae.to(memory_format=torch.channels_last)
+
+# int8 weights halve the UNet's memory traffic, the VAE stays in FP16 since it only decodes once
+quantize(pipe.unet, weights=qint8)
+freeze(pipe.unet)
+pipe.unet = torch.compile(pipe.unet, mode="max-autotune", fullgraph=True)
+
+# Pass prompts as arguments, e.g. python 2-1.py "a red fox" "a blue whale"
+prompts = sys.argv[1:] or ["a cute kitten is wearing a plastic mask"]
 
-prompts = ["a cute kitten is wearing a plastic mask"]
+# A run with fewer prompts than BATCH_SIZE is a single batch of just those prompts
+batch_size = min(BATCH_SIZE, len(prompts))
 
-results = pipe(
-    prompts,
-    num_inference_steps=20,
-    guidance_scale=3.5,
-    height=512,
-    width=512
-)
+images = []
+for b in range(math.ceil(len(prompts) / batch_size)):
+    batch = prompts[b * batch_size:(b + 1) * batch_size]
+    seeds = range(b * batch_size, b * batch_size + len(batch))
 
-images = results.images
+    results = pipe(
+        batch,
+        num_inference_steps=20,
+        guidance_scale=3.5,
+        height=512,
+        width=512,
+        generator=[torch.Generator("cuda").manual_seed(s) for s in seeds]
+    )
+    images.extend(results.images)
 
 # Save or display the images
 for i, img in enumerate(images):
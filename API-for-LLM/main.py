@@ -1,5 +1,8 @@
-from fastapi import FastAPI, Depends, HTTPException, Header
-from ollama import Client
+from fastapi import FastAPI, Depends, HTTPException, Header, Request
+from fastapi.responses import StreamingResponse
+from ollama import AsyncClient
+import redis.asyncio as redis
+import httpx
 import os
 from dotenv import load_dotenv
 
@@ -11,17 +14,47 @@ print(API_KEY_CREDITS)
 
 app = FastAPI()
 
-def verify_api_key(x_api_key: str = Header(None)):
-    credits = API_KEY_CREDITS.get(x_api_key, 0)
-    if credits <= 0:
+# Credits live in Redis so every worker shares them and DECR keeps the count atomic
+r = redis.Redis.from_url(os.environ.get("REDIS_URL", "redis://localhost:6379"))
+
+@app.on_event("startup")
+async def seed_credits():
+    for api_key, credits in API_KEY_CREDITS.items():
+        await r.set(f"credits:{api_key}", credits, nx=True)
+
+# One Ollama client per process, its httpx pool keeps connections to Ollama alive between requests
+@app.on_event("startup")
+async def create_client():
+    app.state.client = AsyncClient(
+        host=OLLAMA_BASE_URL,
+        timeout=httpx.Timeout(60.0),
+        limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+    )
+
+@app.on_event("shutdown")
+async def close_client():
+    await app.state.client.close()
+    await r.aclose()
+
+async def verify_api_key(x_api_key: str = Header(None)):
+    key = f"credits:{x_api_key}"
+    if not await r.exists(key):
         raise HTTPException(status_code=401, detail="Invalid API Key, or no credits")
-    
-    return x_api_key 
 
-client = Client(host=OLLAMA_BASE_URL)
+    remaining = await r.decr(key)
+    if remaining < 0:
+        await r.incr(key)
+        raise HTTPException(status_code=401, detail="Invalid API Key, or no credits")
+
+    return x_api_key 
 
 @app.post("/generate")
-def generate(prompt: str, x_api_key: str = Depends(verify_api_key)):
-    API_KEY_CREDITS[x_api_key] -= 1
-    response = client.chat(model="mistral:7b", messages=[{"role": "user", "content": prompt}])
-    return {"response": response["message"]["content"]}
\ No newline at end of file
+async def generate(request: Request, prompt: str, x_api_key: str = Depends(verify_api_key)):
+    client = request.app.state.client
+
+    # Send tokens as Ollama produces them instead of waiting for the full reply
+    async def stream_tokens():
+        async for part in await client.chat(model="mistral:7b", messages=[{"role": "user", "content": prompt}], stream=True):
+            yield part["message"]["content"]
+
+    return StreamingResponse(stream_tokens(), media_type="text/plain")
\ No newline at end of file
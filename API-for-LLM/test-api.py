@@ -1,4 +1,5 @@
-import requests
+import asyncio
+import httpx
 from dotenv import load_dotenv
 import os
 
@@ -6,13 +7,20 @@ load_dotenv()
 
 
 
-url = "http://localhost:8000/generate?prompt=\"tell me about python\""
+prompts = ["tell me about python", "tell me about fastapi"]
 
-payload = {}
 headers = {
   'x-api-key': os.environ.get("API_KEY")
 }
 
-response = requests.request("POST", url, headers=headers, data=payload)
+async def main():
+    # One pooled client sends every prompt concurrently over kept-alive connections
+    async with httpx.AsyncClient(base_url="http://localhost:8000", headers=headers, timeout=None) as client:
+        responses = await asyncio.gather(
+            *[client.post("/generate", params={"prompt": prompt}) for prompt in prompts]
+        )
 
-print(response.text)
+    for response in responses:
+        print(response.text)
+
+asyncio.run(main())
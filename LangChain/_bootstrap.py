@@ -0,0 +1,5 @@
+from langchain_community.cache import SQLiteCache
+from langchain_core.globals import set_llm_cache
+
+# Repeated prompts are answered from disk instead of another OpenAI round-trip
+set_llm_cache(SQLiteCache(database_path=".langchain.db"))
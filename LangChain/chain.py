@@ -2,12 +2,16 @@ from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import BaseOutputParser
 from dotenv import load_dotenv
+import _bootstrap  # noqa: F401  shared LLM response cache
+import re
 
 load_dotenv()
 
+_COMMA_RE = re.compile(r"\s*,\s*")
+
 class CommaSeparatedListOutputParser(BaseOutputParser):
     def parse(self, text: str):
-        return text.strip().split(", ")
+        return [s for s in _COMMA_RE.split(text.strip()) if s]
 
 llm = ChatOpenAI(model="gpt-5-nano")
 
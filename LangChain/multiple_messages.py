@@ -1,6 +1,7 @@
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 from dotenv import load_dotenv
+import _bootstrap  # noqa: F401  shared LLM response cache
 import os
 
 load_dotenv()
@@ -2,18 +2,20 @@ from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import BaseOutputParser
 from dotenv import load_dotenv
-import re
+import _bootstrap  # noqa: F401  shared LLM response cache
 
 load_dotenv()
 
 class MathAnswerParser(BaseOutputParser[dict]):
     def parse(self, text: str) -> dict:
-        match = re.search(r"answer = (.+)", text)
-        if not match:
+        # The answer marker is a fixed literal, so no regex is needed;
+        # the answer is the rest of the marker's line
+        steps, sep, answer = text.rpartition("answer = ")
+        if not sep:
             raise ValueError("Output does not contain 'answer = <value>'")
         return {
-            "steps": text[:match.start()].strip(),
-            "answer": match.group(1).strip()
+            "steps": steps.strip(),
+            "answer": answer.partition("\n")[0].strip()
         }
     
     def get_format_instructions(self) -> str:
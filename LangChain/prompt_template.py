@@ -1,6 +1,7 @@
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from dotenv import load_dotenv
+import _bootstrap  # noqa: F401  shared LLM response cache
 
 load_dotenv()
 
@@ -1,5 +1,6 @@
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
+import _bootstrap  # noqa: F401  shared LLM response cache
 import os
 
 load_dotenv()
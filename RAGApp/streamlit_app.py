@@ -6,7 +6,7 @@ import streamlit as st
 import inngest
 from dotenv import load_dotenv
 import os
-import requests
+import httpx
 
 load_dotenv()
 
@@ -18,6 +18,15 @@ def get_inngest_client() -> inngest.Inngest:
     return inngest.Inngest(app_id="rag_app", is_production=False)
 
 
+@st.cache_resource
+def get_http_client() -> httpx.Client:
+    # Shared across reruns so polling the Inngest API reuses kept-alive connections
+    return httpx.Client(
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+    )
+
+
 def save_uploaded_pdf(file) -> Path:
     uploads_dir = Path("uploads")
     uploads_dir.mkdir(parents=True, exist_ok=True)
@@ -79,14 +88,14 @@ def _inngest_api_base() -> str:
 
 def fetch_runs(event_id: str) -> list[dict]:
     url = f"{_inngest_api_base()}/events/{event_id}/runs"
-    resp = requests.get(url)
+    resp = get_http_client().get(url)
     resp.raise_for_status()
     data = resp.json()
     return data.get("data", [])
 
 
 def wait_for_run_output(event_id: str, timeout_s: float = 120.0, poll_interval_s: float = 0.5) -> dict:
-    start = time.time()
+    start = time.perf_counter()
     last_status = None
     while True:
         runs = fetch_runs(event_id)
@@ -98,7 +107,7 @@ def wait_for_run_output(event_id: str, timeout_s: float = 120.0, poll_interval_s
                 return run.get("output") or {}
             if status in ("Failed", "Cancelled"):
                 raise RuntimeError(f"Function run {status}")
-        if time.time() - start > timeout_s:
+        if time.perf_counter() - start > timeout_s:
             raise TimeoutError(f"Timed out waiting for run output (last status: {last_status})")
         time.sleep(poll_interval_s)
 
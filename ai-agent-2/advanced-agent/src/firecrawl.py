@@ -4,12 +4,13 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY")
+
 class FirecrawlService:
     def __init__(self):
-        api_key = os.getenv("FIRECRAWL_API_KEY")
-        if not api_key:
+        if not FIRECRAWL_API_KEY:
             raise ValueError("Missing FIRECRAWL_API_KEY environment variable")
-        self.app = FirecrawlApp(api_key=api_key)
+        self.app = FirecrawlApp(api_key=FIRECRAWL_API_KEY)
 
     def search_companies(self, query: str, num_results: int = 5):
         try:
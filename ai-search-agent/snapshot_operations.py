@@ -6,13 +6,14 @@ from typing import List, Dict, Any, Optional
 
 load_dotenv()
 
+BRIGHTDATA_API_KEY = os.getenv("BRIGHTDATA_API_KEY")
+
 
 def poll_snapshot_status(
     snapshot_id: str, max_attempts: int = 60, delay: int = 5
 ) -> bool:
-    api_key = os.getenv("BRIGHTDATA_API_KEY")
     progress_url = f"https://api.brightdata.com/datasets/v3/progress/{snapshot_id}"
-    headers = {"Authorization": f"Bearer {api_key}"}
+    headers = {"Authorization": f"Bearer {BRIGHTDATA_API_KEY}"}
 
     for attempt in range(max_attempts):
         try:
@@ -50,11 +51,10 @@ def poll_snapshot_status(
 def download_snapshot(
     snapshot_id: str, format: str = "json"
 ) -> Optional[List[Dict[Any, Any]]]:
-    api_key = os.getenv("BRIGHTDATA_API_KEY")
     download_url = (
         f"https://api.brightdata.com/datasets/v3/snapshot/{snapshot_id}?format={format}"
     )
-    headers = {"Authorization": f"Bearer {api_key}"}
+    headers = {"Authorization": f"Bearer {BRIGHTDATA_API_KEY}"}
 
     try:
         print("📥 Downloading snapshot data...")
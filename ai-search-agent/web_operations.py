@@ -6,13 +6,13 @@ from snapshot_operations import download_snapshot, poll_snapshot_status
 
 load_dotenv()
 
+BRIGHTDATA_API_KEY = os.getenv("BRIGHTDATA_API_KEY")
+
 dataset_id = "gd_lvz8ah06191smkebj4"
 
 def _make_api_request(url, **kwargs):
-    api_key = os.getenv("BRIGHTDATA_API_KEY")
-
     headers = {
-        "Authorization": f"Bearer {api_key}",
+        "Authorization": f"Bearer {BRIGHTDATA_API_KEY}",
         "Content-Type": "application/json",
     }
 
@@ -0,0 +1,27 @@
+from llama_index.core import Document
+from llama_index.core.readers.base import BaseReader
+import hashlib
+import os
+
+CACHE_DIR = "cache"
+
+class CachedParser(BaseReader):
+    """Wraps a parser and reuses its markdown for files whose content hasn't changed"""
+
+    def __init__(self, parser):
+        self.parser = parser
+
+    def load_data(self, file, extra_info=None):
+        with open(file, "rb") as f:
+            file_hash = hashlib.sha256(f.read()).hexdigest()
+
+        cache_path = os.path.join(CACHE_DIR, f"{file_hash}.md")
+        if os.path.exists(cache_path):
+            with open(cache_path, "r") as f:
+                return [Document(text=f.read(), metadata=extra_info or {})]
+
+        documents = self.parser.load_data(file, extra_info=extra_info)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w") as f:
+            f.write("\n\n".join(doc.text for doc in documents))
+        return documents
@@ -5,8 +5,12 @@ from llama_index.core import (
     SimpleDirectoryReader,
     PromptTemplate,
     Settings,
+    StorageContext,
+    load_index_from_storage,
 )
 from llama_index.embeddings.ollama import OllamaEmbedding
+from llama_index.vector_stores.faiss import FaissVectorStore
+from llama_index.core.readers.file.base import default_file_metadata_func
 from llama_index.core.tools import QueryEngineTool, ToolMetadata
 from llama_index.core.agent import ReActAgent
 from llama_index.core.output_parsers import PydanticOutputParser
@@ -16,13 +20,17 @@ from dotenv import load_dotenv
 
 from prompts import context, code_parser_template
 from code_reader import code_reader
+from cached_parser import CachedParser
 
+import faiss
 import os
 
 load_dotenv()
 os.makedirs("output", exist_ok=True)
 
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL")
+STORAGE_DIR = "./storage"
+EMBED_DIM = 768  # nomic-embed-text
 
 Settings.llm = Ollama(
     model="qwen2.5:3b", 
@@ -31,19 +39,51 @@ Settings.llm = Ollama(
     temperature=0.2
 )
 
-pdf_parser = LlamaParse(result_type="markdown")
+def file_metadata(file_path):
+    # The access date changes on every read and is part of the document hash,
+    # leaving it in would make refresh_ref_docs treat unchanged files as changed
+    metadata = default_file_metadata_func(file_path)
+    metadata.pop("last_accessed_date", None)
+    return metadata
+
+pdf_parser = CachedParser(LlamaParse(result_type="markdown"))
 
 documents = SimpleDirectoryReader(
     "./data", 
     file_extractor={".pdf": pdf_parser},
+    filename_as_id=True,
+    file_metadata=file_metadata,
 ).load_data()
 
+# Send up to 64 chunks per embedding request instead of one round-trip each
 Settings.embed_model = OllamaEmbedding(
     model_name="nomic-embed-text", 
-    base_url=OLLAMA_BASE_URL
+    base_url=OLLAMA_BASE_URL,
+    embed_batch_size=64,
 )
 
-vector_index = VectorStoreIndex.from_documents(documents)
+# Reuse the persisted embeddings and only re-embed documents whose content hash changed
+def build_index():
+    # HNSW graph search in FAISS instead of a brute-force scan over every chunk
+    vector_store = FaissVectorStore(faiss_index=faiss.IndexHNSWFlat(EMBED_DIM, 32))
+    storage_context = StorageContext.from_defaults(vector_store=vector_store)
+    return VectorStoreIndex.from_documents(documents, storage_context=storage_context)
+
+if os.path.exists(STORAGE_DIR):
+    vector_store = FaissVectorStore.from_persist_dir(STORAGE_DIR)
+    storage_context = StorageContext.from_defaults(
+        vector_store=vector_store, persist_dir=STORAGE_DIR
+    )
+    vector_index = load_index_from_storage(storage_context)
+    try:
+        vector_index.refresh_ref_docs(documents)
+    except NotImplementedError:
+        # FAISS can't delete vectors, so a changed document means rebuilding the index
+        vector_index = build_index()
+else:
+    vector_index = build_index()
+
+vector_index.storage_context.persist(persist_dir=STORAGE_DIR)
 
 query_engine = vector_index.as_query_engine(
     llm=Settings.llm
@@ -85,26 +125,27 @@ json_prompt = PromptTemplate(
     output_parser=output_parser,
 )
 
+# JSON mode constrains decoding to valid JSON, so the parser succeeds without retries
+json_llm = Ollama(
+    model="qwen2.5:3b", 
+    base_url=OLLAMA_BASE_URL, 
+    request_timeout=120.0,
+    temperature=0.2,
+    json_mode=True,
+)
+
 output_pipeline = QueryPipeline(
-    chain=[json_prompt, Settings.llm, output_parser])
+    chain=[json_prompt, json_llm, output_parser])
 
 while (prompt := input("Enter a prompt (q to quit): ")) != "q":
-    retries = 0
-    
-    while retries < 3:
-        try:    
-            agent_result = agent.query(prompt)
-
-            parsed: CodeOutput = output_pipeline.run(
-                response=agent_result
-            )
-            break
-        except Exception as e:
-            retries += 1
-            print("Error occured, retry #{retries}:", e)
-    
-    if retries == 3:
-        print("Unable to process request, try again...")
+    try:    
+        agent_result = agent.query(prompt)
+
+        parsed: CodeOutput = output_pipeline.run(
+            response=agent_result
+        )
+    except Exception as e:
+        print("Unable to process request, try again...", e)
         continue
 
     print("\n--- Code Generated ---\n")
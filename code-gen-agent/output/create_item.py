@@ -1,4 +1,4 @@
-import requests
+import httpx
 
 # Define the URL of the POST endpoint for creating a new item
 url = 'http://localhost:5000/items'
@@ -10,7 +10,8 @@ data = {
 }
 
 # Send a POST request to create a new item
-response = requests.post(url, json=data)
+with httpx.Client() as client:
+    response = client.post(url, json=data)
 
 # Check if the request was successful
 if response.status_code == 201:
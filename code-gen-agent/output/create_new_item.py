@@ -1,4 +1,4 @@
-import requests
+import httpx
 
 # Define the URL of the Flask app
 target_url = "http://localhost:5000/items"
@@ -9,9 +9,12 @@ new_item_data = {
     "description": "This is a new item."
 }
 
+# Reused across calls so repeated posts keep the connection alive
+client = httpx.Client()
+
 # Make a POST request to create the new item
 def post_new_item():
-    response = requests.post(target_url, json=new_item_data)
+    response = client.post(target_url, json=new_item_data)
 
     # Check if the request was successful
     if response.status_code == 201:
@@ -1,7 +1,7 @@
+import os
+
+import torch
 from transformers import pipeline
-from langchain_huggingface import HuggingFacePipeline
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import StrOutputParser
 from transformers.utils.logging import set_verbosity_error
 
 # Hide unnecessary warnings
@@ -16,14 +16,14 @@ length_map = {
 }
 
 # 2. Initialize Pipelines
-# Note: device=1 as per your original setup for GPU
+# device_map="auto" lets Accelerate place the layers, FP16 halves the weight bandwidth
 summarization_pipeline = pipeline(
     "summarization", 
     model="facebook/bart-large-cnn", 
-    device=1,
+    device_map="auto",
+    torch_dtype=torch.float16,
     do_sample=False
 )
-summarizer = HuggingFacePipeline(pipeline=summarization_pipeline)
 
 qa_pipeline = pipeline(
     "question-answering", 
@@ -31,15 +31,9 @@ qa_pipeline = pipeline(
     device=1
 )
 
-# 3. Create a clean chain
-# We skip the "Refiner" step here because double-summarizing often causes 
-# the repetitive "AI Engineer" bug you saw.
-summary_template = PromptTemplate.from_template("{text}")
-summarization_chain = summary_template | summarizer | StrOutputParser()
-
 # --- INPUT SECTION ---
 print("\n--- AI Document Assistant ---")
-text_to_summarize = input("Enter text to summarize:\n> ")
+text_to_summarize = input("Enter text to summarize, or a folder of .txt files:\n> ")
 length_input = input("\nEnter the length (short/medium/long): ").lower().strip()
 
 # Default to medium if input is weird
@@ -47,17 +41,30 @@ lengths = length_map.get(length_input, length_map["medium"])
 
 print("\n--- Processing Summary... ---")
 
-# 4. Generate Summary with dynamic length
-# We pass the max/min lengths directly to the model call
-summary = summarization_chain.invoke(
-    {"text": text_to_summarize},
-    config={"max_length": lengths["max"], "min_length": lengths["min"]}
+# 3. Generate Summaries with dynamic length
+# A folder is summarized in batches of 8, each batch padded only to its longest text
+if os.path.isdir(text_to_summarize):
+    texts = []
+    for file_name in sorted(os.listdir(text_to_summarize)):
+        if file_name.endswith(".txt"):
+            with open(os.path.join(text_to_summarize, file_name), "r") as f:
+                texts.append(f.read())
+else:
+    texts = [text_to_summarize]
+
+results = summarization_pipeline(
+    texts,
+    batch_size=8,
+    max_length=lengths["max"],
+    min_length=lengths["min"],
+    truncation=True
 )
+summary = "\n\n".join(result["summary_text"] for result in results)
 
 print("\n🔹 **Generated Summary:**")
 print(summary)
 
-# 5. Question & Answer Loop
+# 4. Question & Answer Loop
 print("\n--- Q&A Session (type 'exit' to quit) ---")
 while True:
     question = input("\nAsk a question about the summary:\n> ")
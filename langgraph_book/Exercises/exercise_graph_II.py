@@ -1,4 +1,5 @@
 from typing import TypedDict, Annotated, List
+import math
 import operator
 from langgraph.graph import StateGraph
 
@@ -16,24 +17,16 @@ def process_value(state: State) -> State:
     operation = state["operation"]
 
     if operation == "+":
-        total = 0
-        for i in values:
-            total += i
+        total = sum(values)
         state["result"] = f"Hi {name}, your answer is {total}"
     elif operation == "-":
-        total = 0
-        for i in values:
-            total -= i
+        total = -sum(values)
         state["result"] = f"Hi {name}, your answer is {total}"
     elif operation == "*":
-        total = 1
-        for i in values:
-            total *= i
+        total = math.prod(values)
         state["result"] = f"Hi {name}, your answer is {total}"
     elif operation == "/":
-        total = 1
-        for i in values:
-            total /= i
+        total = 1 / math.prod(values)
         state["result"] = f"Hi {name}, your answer is {total}"    
     else:
         state["result"] = f"Hi {name}, I don't know what to do"
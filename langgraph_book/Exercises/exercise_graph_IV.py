@@ -37,21 +37,21 @@ def subtractor2(state: AgentState) -> AgentState:
     state["finalNumber2"] = state["number3"] - state["number4"]
     return state
 
+# Maps an operation name to the edge that handles it
+OPERATION_EDGES = {
+    "add": "addition_operation",
+    "subtract": "subtraction_operation",
+}
+
 def decide_next_node_1(state: AgentState) -> AgentState:
     """This node decides which node to execute next"""
     
-    if state["operation"] == "add":
-        return "addition_operation"
-    elif state["operation"] == "subtract":
-        return "subtraction_operation"
+    return OPERATION_EDGES[state["operation"]]
 
 def decide_next_node_2(state: AgentState) -> AgentState:
     """This node decides which node to execute next"""
     
-    if state["operation2"] == "add":
-        return "addition_operation"
-    elif state["operation2"] == "subtract":
-        return "subtraction_operation"
+    return OPERATION_EDGES[state["operation2"]]
 
 
 graph = StateGraph(AgentState)
@@ -60,28 +60,25 @@ graph.add_node("add_node", adder)
 graph.add_node("subtract_node", subtractor)
 graph.add_node("add_node2", adder2)
 graph.add_node("subtract_node2", subtractor2)
-graph.add_node("router", lambda state: state) # passthrough function
-graph.add_node("router2", lambda state: state) # passthrough function
 
-graph.add_edge(START, "router")
+# Route straight from the previous step instead of through passthrough router nodes
 graph.add_conditional_edges(
-    "router", 
+    START, 
     decide_next_node_1,
     {
         # Edge: Node
         "addition_operation": "add_node",
         "subtraction_operation": "subtract_node",
     })
-graph.add_conditional_edges(
-    "router2", 
-    decide_next_node_2,
-    {
-        # Edge: Node
-        "addition_operation": "add_node2",
-        "subtraction_operation": "subtract_node2",
-    })
-graph.add_edge("add_node", "router2")
-graph.add_edge("subtract_node", "router2")
+for previous_node in ("add_node", "subtract_node"):
+    graph.add_conditional_edges(
+        previous_node, 
+        decide_next_node_2,
+        {
+            # Edge: Node
+            "addition_operation": "add_node2",
+            "subtraction_operation": "subtract_node2",
+        })
 graph.add_edge("add_node2", END)
 graph.add_edge("subtract_node2", END)
 
@@ -1,8 +1,10 @@
 from langchain_ollama import OllamaLLM
 from langchain_core.prompts import ChatPromptTemplate
-from vector import retriever
+from vector import aretrieve_batch
 
+from aioconsole import ainput
 from dotenv import load_dotenv
+import asyncio
 import os
 
 load_dotenv()
@@ -10,7 +12,10 @@ load_dotenv()
 ollama_base_url = os.getenv("OLLAMA_BASE_URL")
 ollama_model_name = os.getenv("OLLAMA_MODEL_NAME")
 
-model = OllamaLLM(model=ollama_model_name, base_url=ollama_base_url)
+# Upper bound on answers generated at the same time, to stay within what Ollama can serve
+MAX_CONCURRENT = 4
+
+model = OllamaLLM(model=ollama_model_name, base_url=ollama_base_url, client_kwargs={"timeout": 60})
 
 template = """
 You are an expert in answering questions about a pizza restaurant
@@ -23,13 +28,53 @@ Here is the question to answer: {question}
 prompt = ChatPromptTemplate.from_template(template)
 chain = prompt | model
 
-while True:
+async def answer_questions(questions, semaphore, previous):
+    async def answer(question, reviews):
+        async with semaphore:
+            return await chain.ainvoke({"reviews": reviews, "question": question})
+
+    try:
+        all_reviews = await aretrieve_batch(questions)
+        results = await asyncio.gather(*[
+            answer(question, reviews)
+            for question, reviews in zip(questions, all_reviews)
+        ])
+        error = None
+    except Exception as e:
+        results, error = None, e
+
+    # Print in the order the questions were asked, even if this batch finished first.
+    # A failed earlier batch has already reported its own error, so it's not re-raised here.
+    if previous:
+        await asyncio.gather(previous, return_exceptions=True)
     print("\n\n-------------------------------")
-    question = input("Ask your question (q to quit): ")
-    print("\n\n")
-    if question == "q":
-        break
-    
-    reviews =retriever.invoke(question)
-    result = chain.invoke({"reviews": reviews, "question": question})
-    print(result)
\ No newline at end of file
+    if error:
+        print(f"Error answering {questions}: {error}")
+        return
+    for question, result in zip(questions, results):
+        print(f"Q: {question}\n")
+        print(result)
+        print()
+
+async def main():
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    previous = None
+
+    while True:
+        # Several questions can be asked at once, one per line, ending with a blank line.
+        # Earlier questions keep being answered in the background while the next ones are typed.
+        print("\n\nAsk your questions, one per line, blank line to send (q to quit): ")
+        questions = []
+        while (line := (await ainput()).strip()):
+            questions.append(line)
+        if questions == ["q"]:
+            break
+        if not questions:
+            continue
+
+        previous = asyncio.create_task(answer_questions(questions, semaphore, previous))
+
+    if previous:
+        await asyncio.gather(previous, return_exceptions=True)
+
+asyncio.run(main())
\ No newline at end of file
@@ -1,7 +1,9 @@
 from langchain_ollama import OllamaEmbeddings
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
+from collections import OrderedDict
 import os
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 
@@ -9,12 +11,20 @@ load_dotenv()
 
 ollama_base_url = os.getenv("OLLAMA_BASE_URL")
 ollama_embedding_model = os.getenv("OLLAMA_EMBEDDING_MODEL")
+hnsw_search_ef = int(os.getenv("HNSW_SEARCH_EF", "64"))
 
 df = pd.read_csv("realistic_restaurant_reviews.csv")
-embeddings = OllamaEmbeddings(model=ollama_embedding_model, base_url=ollama_base_url)
+# One client for every call, so the connection to Ollama is kept alive between embeds
+embeddings = OllamaEmbeddings(
+    model=ollama_embedding_model,
+    base_url=ollama_base_url,
+    client_kwargs={"timeout": 60}
+)
 
 db_location = "./chrome_langchain_db"
 add_documents = True
+# Number of reviews fetched for each question
+top_k = 5
 
 if add_documents:
     documents = []
@@ -29,15 +39,62 @@ if add_documents:
         ids.append(str(i))
         documents.append(document)
 
+# Chroma searches with an HNSW graph, raise HNSW_SEARCH_EF for better recall at the cost of latency
 vector_store = Chroma(
     collection_name="restaurant_reviews",
     persist_directory=db_location,
-    embedding_function=embeddings
+    embedding_function=embeddings,
+    collection_metadata={
+        "hnsw:space": "cosine",
+        "hnsw:M": 16,
+        "hnsw:construction_ef": 200,
+        "hnsw:search_ef": hnsw_search_ef,
+    }
 )
+# The settings above only apply when the collection is first created, search_ef can be changed afterwards
+vector_store._collection.modify(configuration={"hnsw": {"ef_search": hnsw_search_ef}})
 
 if add_documents:
     vector_store.add_documents(documents=documents, ids=ids)
 
-retriever = vector_store.as_retriever(
-    search_kwargs={"k": 5}
-)
\ No newline at end of file
+class QueryCache:
+    """Reuses the reviews of an earlier question whose embedding is close enough to a new one"""
+
+    def __init__(self, threshold=0.9, max_size=256):
+        self.threshold = threshold
+        self.max_size = max_size
+        self.entries = OrderedDict()  # id -> (normalized vector, reviews)
+        self.next_id = 0
+
+    def get(self, vector):
+        if not self.entries:
+            return None
+        query = np.asarray(vector) / np.linalg.norm(vector)
+        ids = list(self.entries)
+        similarities = np.stack([self.entries[i][0] for i in ids]) @ query
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return None
+        self.entries.move_to_end(ids[best])
+        return self.entries[ids[best]][1]
+
+    def put(self, vector, reviews):
+        self.entries[self.next_id] = (np.asarray(vector) / np.linalg.norm(vector), reviews)
+        self.next_id += 1
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+query_cache = QueryCache()
+
+async def aretrieve_batch(questions):
+    """Embed all questions in a single /api/embed call, then fetch the reviews for each"""
+    vectors = await embeddings.aembed_documents(questions)
+    all_reviews = []
+    for vector in vectors:
+        # Paraphrases of an earlier question skip the vector search
+        reviews = query_cache.get(vector)
+        if reviews is None:
+            reviews = await vector_store.asimilarity_search_by_vector(vector, k=top_k)
+            query_cache.put(vector, reviews)
+        all_reviews.append(reviews)
+    return all_reviews
\ No newline at end of file
@@ -1,6 +1,16 @@
 from src.app import app
+import os
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("src.app:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # Set DEBUG=1 for auto-reload while developing, otherwise run multiple workers (uvloop + httptools when installed)
+    if os.getenv("DEBUG", "").lower() in ("1", "true"):
+        uvicorn.run("src.app:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        uvicorn.run(
+            "src.app:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("WORKERS") or os.cpu_count()),
+        )
\ No newline at end of file